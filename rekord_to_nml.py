@@ -1,273 +1,306 @@
 import base64
 import hashlib
+import os
 import random
-import uuid
-import xml.etree.ElementTree as ET
 import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from operator import methodcaller
 from os.path import exists
 
-from consts import KEY_TO_CODE
+try:
+    import lxml.etree as ET
+    child_nodes = ET.XPath("NODE")
+    # AutoGrid marks are rebuilt from the TEMPO elements
+    cue_marks = ET.XPath("POSITION_MARK[not(@Name='AutoGrid')]")
+except ImportError:
+    # lxml is optional, the standard library parser produces the same NML (only slower)
+    import xml.etree.ElementTree as ET
+    child_nodes = methodcaller("findall", "NODE")
+
+    def cue_marks(track):
+        return [mark for mark in track.iterfind("POSITION_MARK") if mark.get("Name") != "AutoGrid"]
+
+from consts import COLOR_MAP, KEY_TO_CODE
 from utils import (
+    REKORDBOX_TO_TRAKTOR_CUE_TYPE,
+    REKORDBOX_TO_TRAKTOR_KEY,
     get_attribute,
     format_date,
-    get_tonalikey,
-    get_track_color,
-    get_cue_type,
     set_conversion,
     get_location,
-    set_cue_color,
     today,
 )
 
+# Below this many tracks, starting worker processes costs more than converting the collection in-process
+PARALLEL_MIN_TRACKS = 1000
+# Tracks sent to a worker process at once
+PARALLEL_CHUNK_SIZE = 200
+
+# AUDIO_ID contains Base64-encoded audio fingerprint data (spectral analysis, transients, beat info) that Traktor uses for validation.
+# Since we can't generate authentic fingerprints without Native Instruments' algorithms, we use a static placeholder.
+# Imported tracks might require re-analysis in Traktor.
+AUDIO_ID = "AWAWZmRENDMzMzf//////////////////////f/////////////////////s/////////////////////5b///7//////////+//////af/////////////////////+///////////f/////////1n/////////9Y///////////f/////////+r/7///////9XYzMzM0MyMzJUMzNDNDMzRDn//////////////////////f/////////////////////e/////////////////////3r+/+////////7u7u/v////vf//7////////v/+//////+FZneYYQAAAA=="
+
+# Attributes shared by every track, the varying ones are overridden in place to keep the attribute order.
+# Zero defaults are preformatted so that they are only formatted again when they differ.
+MODIFICATION_INFO_ATTRS = {"AUTHOR_TYPE": "user"}
+LOUDNESS_ATTRS = {"PEAK_DB": "-1.0", "PERCEIVED_DB": "-1.0", "ANALYZED_DB": "-1.0"}
+TEMPO_ATTRS = {"BPM": "120.000000", "BPM_QUALITY": "100.000000"}
+BEATMARKER_ATTRS = {
+    "NAME": "Beat Marker",
+    "DISPL_ORDER": "0",
+    "TYPE": "4",
+    "START": "0.000000",
+    "LEN": "0.000000",
+    "REPEATS": "-1",
+    "HOTCUE": "-1",
+}
+AUTOGRID_ATTRS = {
+    "NAME": "AutoGrid",
+    "DISPL_ORDER": "0",
+    "TYPE": "0",
+    "START": "0.000000",
+    "LEN": "0.000000",
+    "REPEATS": "-1",
+    "HOTCUE": "0",
+    "COLOR": "#FFFFFF",
+}
+
+
+def safe_float(value, default=0.0):
+    """Convert an attribute value to float, falling back to default when it is empty or invalid."""
+    try:
+        return float(value) if value else default
+    except ValueError:
+        return default
+
+
+def serialize(element):
+    # Empty elements are self-closed, which Traktor reads like an explicit end tag
+    return ET.tostring(element, encoding="utf-8")
+
+
+def collection_tracks(events):
+    """Yield the TRACK elements of the Rekordbox COLLECTION from iterparse events, releasing each one once consumed."""
+    collection = None
+    for event, element in events:
+        if element.tag == "COLLECTION":
+            collection = element if event == "start" else None
+        # TRACK elements of playlists only reference collection tracks by TrackID
+        elif event == "end" and element.tag == "TRACK" and collection is not None:
+            yield element
+            element.clear()
+            collection.remove(element)
+
+
+class TrackInfo:
+    """Attributes of the track being converted, already in their Traktor format."""
+    __slots__ = (
+        "id", "title", "artist", "album", "key", "bpm", "color", "genre", "playtime", "playcount", "bitrate",
+        "import_date", "modif_date", "last_played", "ranking", "filesize", "location", "comments",
+    )
+
 
 class Rekordbox2Traktor:
     def __init__(self):
         self.root = None
         self.track = None
-        self.cues = []
         self.track_index = 0
-        self.cue_index = 0
-        self.track_info = {}
+        self.track_info = None
         self.tracks = []
         self.track_id_map = {}  # Maps Rekordbox TrackID to NML file path
 
-    def generate_audio_id(self):
-        # AUDIO_ID contains Base64-encoded audio fingerprint data (spectral analysis, transients, beat info) that Traktor uses for validation.
-        # Since we can't generate authentic fingerprints without Native Instruments' algorithms, we use a static placeholder.
-        # Imported tracks might require re-analysis in Traktor.
-        return "AWAWZmRENDMzMzf//////////////////////f/////////////////////s/////////////////////5b///7//////////+//////af/////////////////////+///////////f/////////1n/////////9Y///////////f/////////+r/7///////9XYzMzM0MyMzJUMzNDNDMzRDn//////////////////////f/////////////////////e/////////////////////3r+/+////////7u7u/v////vf//7////////v/+//////+FZneYYQAAAA=="
-
     def set_track_info(self, track):
-        # Helper function to safely convert to float with default
-        def safe_float(value, default=0.0):
-            try:
-                return float(value) if value else default
-            except (ValueError, TypeError):
-                return default
-        
-        # Helper function to safely get attribute with default
-        def safe_get_attr(attr_name, default=""):
-            val = get_attribute(track, attr_name)
-            return val if val else default
-        
-        avg_bpm = safe_get_attr("AverageBpm", "120.0")
-        bitrate = safe_get_attr("BitRate", "320")
-        
-        self.track_info = {
-            'id': get_attribute(track, "TrackId") or uuid.uuid4().hex[:8],
-            'title': safe_get_attr("Name"),
-            'artist': safe_get_attr("Artist"),
-            'album': safe_get_attr("Album"),
-            'key': get_tonalikey(safe_get_attr("Tonality")),
-            'bpm': safe_float(avg_bpm, 120.0),
-            'color': get_track_color(safe_get_attr("Colour")),
-            'genre': safe_get_attr("Genre"),
-            'playtime': safe_get_attr("TotalTime", "0"),
-            'playcount': safe_get_attr("PlayCount", "0"),
-            'bitrate': safe_float(bitrate, 320.0) * 1000,
-            'import_date': format_date(safe_get_attr("DateAdded")),
-            'modif_date': format_date(safe_get_attr("DateModified")),
-            'last_played': format_date(safe_get_attr("LastPlayed")),
-            'ranking': safe_get_attr("Rating", "0"),
-            'filesize': safe_get_attr("Size", "0"),
-            'location': safe_get_attr("Location"),
-            'comments': safe_get_attr("Comments")
-        }
+        # Read the attributes once, missing or empty ones fall back to their default
+        attrs = track.attrib
+
+        info = TrackInfo()
+        info.id = attrs.get("TrackId") or os.urandom(4).hex()
+        info.title = attrs.get("Name", "")
+        info.artist = attrs.get("Artist", "")
+        info.album = attrs.get("Album", "")
+        info.key = REKORDBOX_TO_TRAKTOR_KEY.get(attrs.get("Tonality", ""), "0")
+        info.bpm = safe_float(attrs.get("AverageBpm"), 120.0)
+        info.color = COLOR_MAP.get(attrs.get("Colour", ""), "")
+        info.genre = attrs.get("Genre", "")
+        info.playtime = attrs.get("TotalTime") or "0"
+        info.playcount = attrs.get("PlayCount") or "0"
+        info.bitrate = safe_float(attrs.get("BitRate"), 320.0) * 1000
+        info.import_date = format_date(attrs.get("DateAdded", ""))
+        info.modif_date = format_date(attrs.get("DateModified", ""))
+        info.last_played = format_date(attrs.get("LastPlayed", ""))
+        info.ranking = attrs.get("Rating") or "0"
+        info.filesize = attrs.get("Size") or "0"
+        info.location = get_location(attrs.get("Location", ""))
+        info.comments = attrs.get("Comments", "")
+        self.track_info = info
 
         return self.track_info
 
-    @staticmethod
-    def sec_2_ms(time_sec):
-        return float(time_sec) * 1000 if time_sec else 0
-
     def add_location(self):
-        location_data = get_location(self.track_info['location'])
-        location = ET.SubElement(self.track, "LOCATION",
-                                 DIR=location_data["DIR"],
-                                 FILE=location_data["FILE"],
-                                 VOLUME=location_data["VOLUME"],
-                                 VOLUMEID=location_data["VOLUME"])
+        location_data = self.track_info.location
+        location = ET.SubElement(self.track, "LOCATION", {
+            "DIR": location_data["DIR"],
+            "FILE": location_data["FILE"],
+            "VOLUME": location_data["VOLUME"],
+            "VOLUMEID": location_data["VOLUME"],
+        })
         return location
 
     def add_album(self):
-        if self.track_info['album']:
-            album = ET.SubElement(self.track, "ALBUM", TITLE=self.track_info['album'])
+        if self.track_info.album:
+            album = ET.SubElement(self.track, "ALBUM", {"TITLE": self.track_info.album})
             return album
         return None
 
     def add_modification_info(self):
-        modif = ET.SubElement(self.track, "MODIFICATION_INFO", AUTHOR_TYPE="user")
+        modif = ET.SubElement(self.track, "MODIFICATION_INFO", MODIFICATION_INFO_ATTRS)
         return modif
 
     def add_info(self):
+        track_info = self.track_info
+
         # Handle empty playtime with default value
-        playtime = self.track_info['playtime'] or "0"
-        try:
-            playtime_float = float(playtime)
-        except (ValueError, TypeError):
-            playtime_float = 0.0
+        playtime = track_info.playtime or "0"
+        playtime_float = safe_float(playtime)
         
         # Handle missing key with safe lookup
-        key_code = KEY_TO_CODE.get(self.track_info['key'], "10d")  # Default to C major
+        key_code = KEY_TO_CODE.get(track_info.key, "10d")  # Default to C major
         
         info_attrs = {
-            "BITRATE": str(int(self.track_info['bitrate'])),
-            "GENRE": self.track_info['genre'] or "",
+            "BITRATE": str(int(track_info.bitrate)),
+            "GENRE": track_info.genre or "",
             "KEY": key_code,
-            "PLAYCOUNT": self.track_info['playcount'] or "0",
+            "PLAYCOUNT": track_info.playcount or "0",
             "PLAYTIME": playtime,
             "PLAYTIME_FLOAT": f"{playtime_float:.6f}",
-            "RANKING": self.track_info['ranking'] or "0",
-            "IMPORT_DATE": self.track_info['import_date'] or "",
-            "LAST_PLAYED": self.track_info['last_played'] or "",
+            "RANKING": track_info.ranking or "0",
+            "IMPORT_DATE": track_info.import_date or "",
+            "LAST_PLAYED": track_info.last_played or "",
             "FLAGS": "12",
-            # "FILESIZE": str(int(float(self.track_info['filesize']) / 1024)) if self.track_info['filesize'] else "0",
-            "COLOR": self.track_info['color'] or ""
+            # "FILESIZE": str(int(float(track_info.filesize) / 1024)) if track_info.filesize else "0",
+            "COLOR": track_info.color or ""
         }
 
-        if self.track_info['comments']:
-            info_attrs["COMMENT"] = self.track_info['comments']
+        if track_info.comments:
+            info_attrs["COMMENT"] = track_info.comments
 
-        info = ET.SubElement(self.track, "INFO", **info_attrs)
+        info = ET.SubElement(self.track, "INFO", info_attrs)
         return info
 
     def add_tempo(self):
-        tempo = ET.SubElement(self.track, "TEMPO",
-                              BPM=f"{self.track_info['bpm']:.6f}",
-                              BPM_QUALITY="100.000000")
+        tempo = ET.SubElement(self.track, "TEMPO", {**TEMPO_ATTRS, "BPM": f"{self.track_info.bpm:.6f}"})
         return tempo
 
     def add_loudness(self):
-        loudness = ET.SubElement(self.track, "LOUDNESS",
-                                 PEAK_DB="-1.0",
-                                 PERCEIVED_DB="-1.0",
-                                 ANALYZED_DB="-1.0")
+        loudness = ET.SubElement(self.track, "LOUDNESS", LOUDNESS_ATTRS)
         return loudness
 
     def add_musical_key(self):
-        musical_key = ET.SubElement(self.track, "MUSICAL_KEY", VALUE=self.track_info['key'])
+        musical_key = ET.SubElement(self.track, "MUSICAL_KEY", {"VALUE": self.track_info.key})
         return musical_key
 
-    def add_beatmarker(self, start_ms, bpm, is_autogrid=False):
-        name = "AutoGrid" if is_autogrid else "Beat Marker"
+    def make_beatmarker(self, start_ms, bpm, is_autogrid=False):
+        attrs = dict(BEATMARKER_ATTRS)
+        if start_ms:
+            attrs["START"] = f"{start_ms:.6f}"
+        if is_autogrid:
+            attrs["NAME"] = "AutoGrid"
 
-        cue = ET.SubElement(self.track, "CUE_V2",
-                            NAME=name,
-                            DISPL_ORDER="0",
-                            TYPE="4",
-                            START=f"{start_ms:.6f}",
-                            LEN="0.000000",
-                            REPEATS="-1",
-                            HOTCUE="-1")
+        cue = ET.Element("CUE_V2", attrs)
 
-        grid = ET.SubElement(cue, "GRID", BPM=f"{bpm:.6f}")
+        grid = ET.SubElement(cue, "GRID", {"BPM": f"{bpm:.6f}"})
 
         return cue
 
-    def add_autogrid(self, start_ms):
-        cue = ET.SubElement(self.track, "CUE_V2",
-                            NAME="AutoGrid",
-                            DISPL_ORDER="0",
-                            TYPE="0",
-                            START=f"{start_ms:.6f}",
-                            LEN="0.000000",
-                            REPEATS="-1",
-                            HOTCUE="0",
-                            COLOR="#FFFFFF")
+    def make_autogrid(self, start_ms):
+        attrs = AUTOGRID_ATTRS
+        if start_ms:
+            attrs = {**AUTOGRID_ATTRS, "START": f"{start_ms:.6f}"}
+
+        cue = ET.Element("CUE_V2", attrs)
 
         return cue
 
-    def add_cue(self, position_mark):
+    def make_cue(self, position_mark, cue_index):
         cue_type = get_attribute(position_mark, "Type")
         start_sec = get_attribute(position_mark, "Start")
         end_sec = get_attribute(position_mark, "End")
         num = get_attribute(position_mark, "Num")
         name = get_attribute(position_mark, "Name") or "n.n."
 
-        start_ms = self.sec_2_ms(start_sec)
-        loop_length = 0
+        start_ms = float(start_sec) * 1000 if start_sec else 0.0
+        # Only loops have a length, hot cues keep the preformatted zero
+        loop_length = "0.000000"
         if end_sec:
-            loop_length = self.sec_2_ms(end_sec) - start_ms
+            loop_length = f"{float(end_sec) * 1000 - start_ms:.6f}"
 
-        hotcue = num if num and num != "-1" else str(self.cue_index)
+        hotcue = num if num and num != "-1" else str(cue_index)
 
         cue_attrs = {
             "NAME": name,
             "DISPL_ORDER": "0",
-            "TYPE": get_cue_type(cue_type),
+            "TYPE": REKORDBOX_TO_TRAKTOR_CUE_TYPE.get(cue_type, "0"),
             "START": f"{start_ms:.6f}",
-            "LEN": f"{loop_length:.6f}",
+            "LEN": loop_length,
             "REPEATS": "-1",
             "HOTCUE": hotcue
         }
 
-        cue = ET.SubElement(self.track, "CUE_V2", **cue_attrs)
-        r = get_attribute(position_mark, "Red")
-        g = get_attribute(position_mark, "Green")
-        b = get_attribute(position_mark, "Blue")
-
-        if r and g and b:
-            set_cue_color(cue, r=r, g=g, b=b)
+        # Rekordbox RGB colors have no Traktor equivalent on CUE_V2 (see _set_traktor_cue_color)
+        cue = ET.Element("CUE_V2", cue_attrs)
 
-        self.cue_index += 1
         return cue
 
     def process_tempo(self, track):
         tempo_elements = track.findall("TEMPO")
+        markers = []
 
         if not tempo_elements:
-            self.add_beatmarker(0, self.track_info['bpm'], is_autogrid=True)
-            self.add_autogrid(0)
+            markers.append(self.make_beatmarker(0, self.track_info.bpm, is_autogrid=True))
+            markers.append(self.make_autogrid(0))
 
         elif len(tempo_elements) == 1:
             tempo = tempo_elements[0]
-            start_sec = float(get_attribute(tempo, "Inizio") or "0")
-            bpm = float(get_attribute(tempo, "Bpm") or str(self.track_info['bpm']))
-            start_ms = self.sec_2_ms(start_sec)
+            start_ms = float(get_attribute(tempo, "Inizio") or "0") * 1000
+            bpm = float(get_attribute(tempo, "Bpm") or str(self.track_info.bpm))
 
-            self.add_beatmarker(start_ms, bpm, is_autogrid=True)
-            self.add_autogrid(start_ms)
+            markers.append(self.make_beatmarker(start_ms, bpm, is_autogrid=True))
+            markers.append(self.make_autogrid(start_ms))
 
         else:
             for i, tempo in enumerate(tempo_elements):
-                start_sec = float(get_attribute(tempo, "Inizio") or "0")
-                bpm = float(get_attribute(tempo, "Bpm") or str(self.track_info['bpm']))
-                start_ms = self.sec_2_ms(start_sec)
+                start_ms = float(get_attribute(tempo, "Inizio") or "0") * 1000
+                bpm = float(get_attribute(tempo, "Bpm") or str(self.track_info.bpm))
 
                 is_autogrid = (i == 0)
-                self.add_beatmarker(start_ms, bpm, is_autogrid=is_autogrid)
+                markers.append(self.make_beatmarker(start_ms, bpm, is_autogrid=is_autogrid))
 
                 if is_autogrid:
-                    self.add_autogrid(start_ms)
+                    markers.append(self.make_autogrid(start_ms))
 
-    def process_cues(self, track):
-        position_marks = track.findall("POSITION_MARK")
+        self.track.extend(markers)
 
-        for position_mark in position_marks:
-            name = get_attribute(position_mark, "Name")
-            if name == "AutoGrid":
-                continue
-
-            self.add_cue(position_mark)
+    def process_cues(self, track):
+        # Cues without a pad number are numbered by their position in the track
+        cues = [self.make_cue(position_mark, index) for index, position_mark in enumerate(cue_marks(track), 1)]
+        self.track.extend(cues)
 
     def reset_track(self):
         self.track = None
-        self.cues = []
-        self.cue_index = 1
-        self.track_info = {}
+        self.track_info = None
 
-    def add_entry(self, collection):
+    def add_entry(self):
         info = self.track_info
 
-        entry = ET.SubElement(
-            collection,
-            "ENTRY",
-            MODIFIED_DATE= info['modif_date'] or today(),
-            MODIFIED_TIME="0", # TODO change
-            AUDIO_ID=self.generate_audio_id(),
-            TITLE=info['title'],
-            ARTIST=info['artist']
-        )
+        entry = ET.Element("ENTRY", {
+            "MODIFIED_DATE": info.modif_date or today(),
+            "MODIFIED_TIME": "0",  # TODO change
+            "AUDIO_ID": AUDIO_ID,
+            "TITLE": info.title,
+            "ARTIST": info.artist,
+        })
         return entry
 
     def add_playlists_section(self):
@@ -278,54 +311,56 @@ class Rekordbox2Traktor:
 
     def process_playlist_node(self, rekordbox_node, parent_subnodes):
         """
-        Recursively process a Rekordbox playlist node (folder or playlist).
+        Process a Rekordbox playlist node (folder or playlist).
         
         Args:
             rekordbox_node: Rekordbox NODE element
             parent_subnodes: Parent NML SUBNODES element (or NODE element if it needs SUBNODES created)
+
+        Returns:
+            The (child NODE, NML SUBNODES) pairs still to process for a folder, an empty list otherwise
         """
         node_type = get_attribute(rekordbox_node, "Type")
         node_name = get_attribute(rekordbox_node, "Name")
         
         if not node_name:
-            return
+            return []
         
         if node_type == "0":  # Folder
             # Create a folder node in NML
-            folder_node = ET.SubElement(parent_subnodes, "NODE", TYPE="FOLDER", NAME=node_name)
+            folder_node = ET.SubElement(parent_subnodes, "NODE", {"TYPE": "FOLDER", "NAME": node_name})
             subnodes = ET.SubElement(folder_node, "SUBNODES")
             
-            # Process child nodes
-            child_count = 0
-            for child in rekordbox_node.findall("NODE"):
-                self.process_playlist_node(child, subnodes)
-                child_count += 1
-            
-            subnodes.set("COUNT", str(child_count))
+            # Child nodes are processed by the caller
+            children = child_nodes(rekordbox_node)
+            subnodes.set("COUNT", str(len(children)))
+            return [(child, subnodes) for child in children]
             
         elif node_type == "1":  # Playlist
             # Get all TRACK elements from the Rekordbox playlist
             track_elements = rekordbox_node.findall("TRACK")
             
             if not track_elements:
-                return
+                return []
             
             # Create playlist node in NML
-            playlist_node = ET.SubElement(parent_subnodes, "NODE", TYPE="PLAYLIST", NAME=node_name)
-            playlist = ET.SubElement(
-                playlist_node, "PLAYLIST",
-                ENTRIES=str(len(track_elements)),
-                TYPE="LIST",
-                UUID=uuid.uuid4().hex
-            )
+            playlist_node = ET.SubElement(parent_subnodes, "NODE", {"TYPE": "PLAYLIST", "NAME": node_name})
+            playlist = ET.SubElement(playlist_node, "PLAYLIST", {
+                "ENTRIES": str(len(track_elements)),
+                "TYPE": "LIST",
+                "UUID": os.urandom(16).hex(),
+            })
             
             # Add tracks to playlist by mapping TrackID to file path
+            SubElement = ET.SubElement
+            file_path_of = self.track_id_map.get
             for track_elem in track_elements:
-                track_id = get_attribute(track_elem, "Key")
-                if track_id and track_id in self.track_id_map:
-                    file_path = self.track_id_map[track_id]
-                    entry = ET.SubElement(playlist, "ENTRY")
-                    primary_key = ET.SubElement(entry, "PRIMARYKEY", TYPE="TRACK", KEY=file_path)
+                file_path = file_path_of(track_elem.get("Key"))
+                if file_path:
+                    entry = SubElement(playlist, "ENTRY")
+                    primary_key = SubElement(entry, "PRIMARYKEY", {"TYPE": "TRACK", "KEY": file_path})
+
+        return []
 
     def process_playlists(self, rekordbox_root):
         """
@@ -350,12 +385,13 @@ class Rekordbox2Traktor:
         root_node = playlists_section.find("NODE")
         if root_node is not None:
             # Process all child nodes of ROOT (add them to subnodes)
-            child_count = 0
-            for node in root_node.findall("NODE"):
-                self.process_playlist_node(node, subnodes)
-                child_count += 1
-            
-            subnodes.set("COUNT", str(child_count))
+            children = child_nodes(root_node)
+            subnodes.set("COUNT", str(len(children)))
+
+            # Walk the folder tree depth-first, children are pushed in reverse to keep their order
+            stack = [(node, subnodes) for node in reversed(children)]
+            while stack:
+                stack.extend(reversed(self.process_playlist_node(*stack.pop())))
         else:
             # No ROOT node, create default playlist
             self.add_default_playlist()
@@ -370,18 +406,20 @@ class Rekordbox2Traktor:
             playlist_node, "PLAYLIST",
             ENTRIES=str(len(self.tracks)),
             TYPE="LIST",
-            UUID=uuid.uuid4().hex
+            UUID=os.urandom(16).hex()
         )
         
+        SubElement = ET.SubElement
         for track_loc in self.tracks:
-            entry = ET.SubElement(playlist, "ENTRY")
-            primary_key = ET.SubElement(entry, "PRIMARYKEY", TYPE="TRACK", KEY=track_loc)
+            entry = SubElement(playlist, "ENTRY")
+            primary_key = SubElement(entry, "PRIMARYKEY", {"TYPE": "TRACK", "KEY": track_loc})
 
-    def process_track(self, track, collection):
+    def process_track(self, track):
+        """Build the NML ENTRY of a Rekordbox TRACK, detached from the collection so it can be written right away."""
         self.reset_track()
 
         self.set_track_info(track)
-        self.track = self.add_entry(collection)
+        self.track = self.add_entry()
 
         self.add_location()
         self.add_album()
@@ -394,16 +432,12 @@ class Rekordbox2Traktor:
         self.process_tempo(track)
         self.process_cues(track)
 
-        return True
+        return self.track
 
     def add_head(self):
         head = ET.SubElement(self.root, "HEAD", COMPANY="www.native-instruments.com", PROGRAM="Traktor Pro 4")
         return head
 
-    def add_collection(self, entries):
-        collection = ET.SubElement(self.root, "COLLECTION", ENTRIES=str(len(entries)))
-        return collection
-
     def add_sets(self, entries=[]):
         sets = ET.SubElement(self.root, "SETS", ENTRIES=str(len(entries)))
         return sets
@@ -412,41 +446,106 @@ class Rekordbox2Traktor:
         indexing = ET.SubElement(self.root, "INDEXING")
         return indexing
 
-    def convert_xml_to_nml(self, xml_file, nml_file):
-        tree = ET.parse(xml_file)
-        root = tree.getroot()
+    def write_sections(self, nml):
+        """Write the sections added to the NML root so far and release them."""
+        for section in list(self.root):
+            nml.write(serialize(section))
+            self.root.remove(section)
 
-        self.root = ET.Element("NML", VERSION="20")
+    def convert_track(self, track):
+        """
+        Convert a Rekordbox TRACK to its serialized NML entry.
 
-        entries = root.findall(".//TRACK")
+        Returns:
+            The serialized ENTRY, the Rekordbox TrackID and the NML file path of the track
+        """
+        track_id = get_attribute(track, "TrackID")
+        entry = serialize(self.process_track(track))
+
+        loc = self.track_info.location
+        return entry, track_id, f"{loc['VOLUME']}{loc['DIR']}{loc['FILE']}"
+
+    def write_entry(self, nml, entry, track_id, file_path):
+        """Write a converted NML entry and map its TrackID to the NML file path."""
+        nml.write(entry)
+        self.tracks.append(file_path)
+
+        # Map TrackID to file path for playlist processing
+        if track_id:
+            self.track_id_map[track_id] = file_path
+
+        self.track_index += 1
+
+    def write_collection(self, nml, tracks):
+        for track in tracks:
+            self.write_entry(nml, *self.convert_track(track))
+
+    def write_collection_parallel(self, nml, tracks):
+        """Convert chunks of tracks in worker processes, writing their entries back in collection order."""
+        with ProcessPoolExecutor(initializer=init_worker) as executor:
+            # Bound the chunks in flight so that the input is still streamed
+            max_pending = 2 * (os.cpu_count() or 1)
+            pending = deque()
+
+            def write_next():
+                for converted in pending.popleft().result():
+                    self.write_entry(nml, *converted)
+
+            chunk = []
+            for track in tracks:
+                chunk.append(serialize(track))
+                if len(chunk) == PARALLEL_CHUNK_SIZE:
+                    pending.append(executor.submit(convert_chunk, chunk))
+                    chunk = []
+                    if len(pending) > max_pending:
+                        write_next()
+            if chunk:
+                pending.append(executor.submit(convert_chunk, chunk))
+
+            while pending:
+                write_next()
 
-        self.add_head()
-        collection = self.add_collection(entries)
+    def convert_xml_to_nml(self, xml_file, nml_file):
+        self.root = ET.Element("NML", VERSION="20")
 
         self.tracks = []
         self.track_id_map = {}
 
-        # Process all tracks and build TrackID -> file path mapping
-        for track in entries:
-            track_id = get_attribute(track, "TrackID")
-            if self.process_track(track, collection):
-                loc = get_location(get_attribute(track, "Location"))
-                file_path = f"{loc['VOLUME']}{loc['DIR']}{loc['FILE']}"
-                self.tracks.append(file_path)
-                
-                # Map TrackID to file path for playlist processing
-                if track_id:
-                    self.track_id_map[track_id] = file_path
-                
-                self.track_index += 1
-
-        self.add_sets()
-        # Process playlists from Rekordbox XML
-        self.process_playlists(root)
-        self.add_indexing()
-
-        tree = ET.ElementTree(self.root)
-        tree.write(nml_file, encoding="utf-8", xml_declaration=True, short_empty_elements=False)
+        # COLLECTION needs its ENTRIES count before the first entry is written: count the tracks in a first pass
+        entries = sum(1 for _ in collection_tracks(ET.iterparse(xml_file, events=("start", "end"))))
+
+        # Both files are streamed: each collection TRACK is converted, written and released as soon as it is parsed
+        with open(nml_file, "wb", buffering=1 << 20) as nml:
+            nml.write(b'<?xml version="1.0" encoding="UTF-8"?>\n<NML VERSION="20">')
+            self.add_head()
+            self.write_sections(nml)
+
+            rekordbox = ET.iterparse(xml_file, events=("start", "end"))
+            nml.write(f'<COLLECTION ENTRIES="{entries}">'.encode())
+            if entries >= PARALLEL_MIN_TRACKS and (os.cpu_count() or 1) > 1:
+                self.write_collection_parallel(nml, collection_tracks(rekordbox))
+            else:
+                self.write_collection(nml, collection_tracks(rekordbox))
+            nml.write(b"</COLLECTION>")
+
+            self.add_sets()
+            # Process playlists from Rekordbox XML, which is all that is left of the parsed document
+            self.process_playlists(rekordbox.root)
+            self.add_indexing()
+            self.write_sections(nml)
+
+            nml.write(b"</NML>")
+
+
+def init_worker():
+    # Worker processes do not run the __main__ block when they are spawned
+    set_conversion("rekordbox", "traktor")
+
+
+def convert_chunk(tracks):
+    """Convert serialized Rekordbox TRACK elements in a worker process, see Rekordbox2Traktor.convert_track."""
+    converter = Rekordbox2Traktor()
+    return [converter.convert_track(ET.fromstring(track)) for track in tracks]
 
 
 if __name__ == "__main__":
@@ -470,8 +569,6 @@ if __name__ == "__main__":
     else:
         filepath = xml_file.replace(".xml", "").replace(".rekordbox", "")
         nml_file = f"{filepath}.nml"
-    
-    open(nml_file, "w").close()
 
     converter = Rekordbox2Traktor()
     converter.convert_xml_to_nml(xml_file, nml_file)
@@ -66,11 +66,15 @@ def get_track_color(color):
     return ""
 
 
+# Rekordbox: Cue = "0", Loop = "4"
+# Traktor: Cue = "0", Fade-In = "1", Fade-Out = "2", Load = "3", AutoGrid / Grid = "4", Loop = "5"
+# Any other Rekordbox type is converted to a Traktor cue ("0")
+REKORDBOX_TO_TRAKTOR_CUE_TYPE = {"0": "0", "4": "5"}
+
+
 def _get_traktor_cue_type(rekordbox_type):
     """Convert Rekordbox cue type to Traktor cue type."""
-    # Rekordbox: Cue = "0", Loop = "4"
-    # Traktor: Cue = "0", Fade-In = "1", Fade-Out = "2", Load = "3", AutoGrid / Grid = "4", Loop = "5"
-    return "5" if rekordbox_type == "4" else "0"
+    return REKORDBOX_TO_TRAKTOR_CUE_TYPE.get(rekordbox_type, "0")
 
 
 def _get_rekordbox_cue_type(traktor_type):
@@ -88,28 +92,16 @@ def get_cue_type(ctype):
     return "0"
 
 
-def _convert_camelot_to_standard(camelot_key):
-    """Convert Camelot wheel notation (e.g., '7A', '1B') to standard musical key."""
-    if not camelot_key:
-        return ""
-    # Check if it's Camelot format (number + A or B)
-    if len(camelot_key) >= 2 and camelot_key[-1] in ['A', 'B']:
-        return CAMELOT_WHEEL_MAP.get(camelot_key, "")
-    return ""
+# Rekordbox tonality (standard or Camelot wheel notation) to Traktor musical key
+REKORDBOX_TO_TRAKTOR_KEY = {
+    **TONALITY_MAP,
+    **{camelot_key: TONALITY_MAP.get(key, "0") for camelot_key, key in CAMELOT_WHEEL_MAP.items()},
+}
 
 
 def _get_traktor_key(tonality):
     """Convert Rekordbox tonality to Traktor musical key."""
-    if not tonality:
-        return "0"
-    
-    # First check if it's Camelot wheel notation
-    standard_key = _convert_camelot_to_standard(tonality)
-    if standard_key:
-        tonality = standard_key
-    
-    # Then look up in TONALITY_MAP
-    return TONALITY_MAP.get(tonality, "0")
+    return REKORDBOX_TO_TRAKTOR_KEY.get(tonality, "0")
 
 
 def _get_rekordbox_tonality(musical_key):